@@ -7,6 +7,10 @@ import logging
 import time
 import os
 import random
+import signal
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from tqdm import tqdm
 from itertools import product
@@ -69,17 +73,32 @@ def get_random_headers():
         "Connection": "keep-alive"
     }
 
-def extract_job_data(card, sort_method, time_filter):
+# Watch mode settings
+WATCH_MAX_JOBS = 50             # Only the newest postings are polled
+WATCH_REQUEST_TIMEOUT = 30      # Seconds before a stalled request is abandoned
+WATCH_MIN_INTERVAL = 60         # Seconds between polls when new jobs keep appearing
+WATCH_MAX_INTERVAL = 600        # Seconds between polls when nothing changes
+WATCH_MAX_SEEN = 20000          # Upper bound on remembered job IDs
+WATCH_DETAIL_RETRIES = 3        # Polls to retry a job's details before skipping it for good
+SEEN_IDS_FILE = Path('data') / 'seen_job_ids.txt'
+
+def get_job_url(card):
+    """Get the clean job URL from a job card"""
+    job_link = card.find("a", {"class": "base-card__full-link"})
+    if not job_link or not job_link.get('href'):
+        return None
+    return job_link.get('href').split('?')[0]
+
+def extract_job_data(card, sort_method, time_filter, fetch_details=True):
     """Extract data from a job card"""
     try:
         job_data = {}
         
         # Get job link and ID
-        job_link = card.find("a", {"class": "base-card__full-link"})
-        if not job_link:
+        job_url = get_job_url(card)
+        if not job_url:
             return None
             
-        job_url = job_link.get('href').split('?')[0]
         job_id = job_url.split('-')[-1]
         
         # Extract basic info from card
@@ -100,9 +119,10 @@ def extract_job_data(card, sort_method, time_filter):
         })
         
         # Get detailed info
-        details = get_job_details(job_id)
-        if details:
-            job_data.update(details)
+        if fetch_details:
+            details = get_job_details(job_id)
+            if details:
+                job_data.update(details)
         
         return job_data
         
@@ -110,12 +130,19 @@ def extract_job_data(card, sort_method, time_filter):
         logger.error(f"Error extracting job data: {str(e)}")
         return None
 
-def get_job_details(job_id):
-    """Get detailed job information"""
+def get_job_details(job_id, timeout=None):
+    """Get detailed job information.
+
+    Returns {} if the posting could not be fetched or parsed, and None if
+    LinkedIn rate limited us or the connection failed.
+    """
     url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
     try:
-        response = requests.get(url, headers=get_random_headers())
+        response = requests.get(url, headers=get_random_headers(), timeout=timeout)
         
+        if response.status_code == 429:
+            return None
+
         if response.status_code != 200:
             return {}
 
@@ -158,6 +185,9 @@ def get_job_details(job_id):
 
         return details
 
+    except requests.RequestException as e:
+        logger.error(f"Error fetching details for job {job_id}: {str(e)}")
+        return None
     except Exception as e:
         logger.error(f"Error fetching details for job {job_id}: {str(e)}")
         return {}
@@ -332,7 +362,208 @@ def scrape_jobs_with_filters(location="Sri Lanka", jobs_per_combination=1000):
                 
     return output_file
 
+class SeenJobIds:
+    """Bounded set of job IDs already reported by watch mode, backed by a file"""
+
+    def __init__(self, path=SEEN_IDS_FILE, max_size=WATCH_MAX_SEEN):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ids = OrderedDict()
+        self.failures = OrderedDict()
+        self.file_lines = 0
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    job_id = line.strip()
+                    if job_id:
+                        self.ids[job_id] = None
+                        self.ids.move_to_end(job_id)
+            self._trim()
+
+        # Rewrite the file so it never grows past max_size between runs
+        self.compact()
+        logger.info(f"Loaded {len(self.ids)} seen job IDs from {self.path}")
+
+    def __contains__(self, job_id):
+        return job_id in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _trim(self):
+        while len(self.ids) > self.max_size:
+            self.ids.popitem(last=False)
+        while len(self.failures) > self.max_size:
+            self.failures.popitem(last=False)
+
+    def add(self, job_id):
+        """Remember a job ID in memory and on disk, evicting the oldest ones"""
+        self.ids[job_id] = None
+        self.ids.move_to_end(job_id)
+        self.failures.pop(job_id, None)
+        self._trim()
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(f"{job_id}\n")
+        self.file_lines += 1
+
+        if self.file_lines > 2 * self.max_size:
+            self.compact()
+
+    def record_failure(self, job_id, max_retries=WATCH_DETAIL_RETRIES):
+        """Count a failed detail fetch and mark the job seen once retries run out.
+
+        Returns True if the job was given up on.
+        """
+        self.failures[job_id] = self.failures.get(job_id, 0) + 1
+        self._trim()
+        if self.failures[job_id] >= max_retries:
+            self.add(job_id)
+            return True
+        return False
+
+    def compact(self):
+        """Rewrite the file with only the remembered IDs, atomically"""
+        self.path.parent.mkdir(exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{job_id}\n" for job_id in self.ids)
+        os.replace(temp_path, self.path)
+        self.file_lines = len(self.ids)
+
+def poll_new_jobs(location, seen, output_file, stop_event):
+    """Poll the newest search results and save jobs that were not seen before.
+
+    Returns the number of new jobs, or None if a search request failed, a
+    detail request hit a connection error, or LinkedIn rate limited us.
+    """
+    base_url = (
+        f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?"
+        f"location={location}&sortBy={SORT_OPTIONS['recent']}"
+        f"&f_TPR={TIME_FILTERS['24h']}&start={{}}"
+    )
+    new_count = 0
+    start = 0
+
+    while start < WATCH_MAX_JOBS and not stop_event.is_set():
+        try:
+            response = requests.get(base_url.format(start), headers=get_random_headers(),
+                                    timeout=WATCH_REQUEST_TIMEOUT)
+
+            if response.status_code == 429:
+                return None
+
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch jobs from offset {start}. Status code: {response.status_code}")
+                return None
+
+            soup = BeautifulSoup(response.text, 'html.parser')
+            job_cards = soup.find_all("div", {"class": "base-card"})
+            if not job_cards:
+                break
+
+            # Pages hold a varying number of cards, so continue right after the last one
+            start += len(job_cards)
+
+            page_new = 0
+            page_unseen = 0
+            for card in job_cards:
+                if stop_event.is_set():
+                    break
+                job_url = get_job_url(card)
+                if not job_url:
+                    continue
+                job_id = job_url.split('-')[-1]
+                if job_id in seen:
+                    continue
+                page_unseen += 1
+
+                job_data = extract_job_data(card, 'recent', '24h', fetch_details=False)
+                if not job_data:
+                    continue
+
+                details = get_job_details(job_id, timeout=WATCH_REQUEST_TIMEOUT)
+                if details is None:
+                    # Rate limited or offline: leave the job unseen so the next poll retries it
+                    return None
+                if not details:
+                    # Withdrawn or broken posting: don't let it hold up the rest of the page
+                    if seen.record_failure(job_id):
+                        logger.warning(f"Giving up on job {job_id} after {WATCH_DETAIL_RETRIES} failed detail fetches")
+                    else:
+                        logger.warning(f"Failed to fetch details for job {job_id}. Will retry next poll")
+                    continue
+                job_data.update(details)
+
+                # Save right away so new postings land in the file within seconds
+                if save_to_csv([job_data], output_file):
+                    seen.add(job_id)
+                    logger.info(f"New job: {job_data['title']} at {job_data['company']}")
+                    page_new += 1
+                stop_event.wait(random.uniform(1, 2))
+
+            new_count += page_new
+
+            # Results are sorted by date, so a page without unseen jobs means we are caught up
+            if page_unseen == 0:
+                break
+
+            stop_event.wait(random.uniform(2, 5))
+
+        except Exception as e:
+            logger.error(f"Error polling jobs from offset {start}: {str(e)}")
+            return None
+
+    return new_count
+
+def watch_jobs(location="Sri Lanka"):
+    """Continuously poll the most recent jobs and save new postings as they appear"""
+    data_dir = Path('data')
+    data_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = data_dir / f"linkedin_jobs_watch_{timestamp}.csv"
+
+    seen = SeenJobIds()
+    stop_event = threading.Event()
+
+    def handle_stop(signum, frame):
+        logger.info("Shutdown requested. Finishing current step...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, handle_stop)
+    signal.signal(signal.SIGTERM, handle_stop)
+
+    interval = WATCH_MIN_INTERVAL
+    logger.info(f"Watching for new jobs in {location}. Saving to {output_file}")
+
+    while not stop_event.is_set():
+        new_count = poll_new_jobs(location, seen, output_file, stop_event)
+
+        # Poll faster while jobs keep appearing, slow down when quiet or rate limited
+        if new_count is None:
+            interval = WATCH_MAX_INTERVAL
+        elif new_count > 0:
+            interval = max(WATCH_MIN_INTERVAL, interval / 2)
+        else:
+            interval = min(WATCH_MAX_INTERVAL, interval * 1.5)
+
+        wait = interval + random.uniform(0, interval * 0.1)
+        if new_count is None:
+            logger.warning(f"Rate limited or request failed. Backing off, next poll in {wait:.0f}s")
+        else:
+            logger.info(f"Found {new_count} new jobs. Next poll in {wait:.0f}s")
+        stop_event.wait(wait)
+
+    logger.info("Watch mode stopped")
+    return output_file
+
 def main():
+    if "--watch" in sys.argv:
+        output_file = watch_jobs()
+        print(f"\nNew jobs saved to {output_file}")
+        return
+
     try:
         while True:
             try: